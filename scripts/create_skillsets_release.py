@@ -24,6 +24,7 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import re
 import subprocess
@@ -35,6 +36,12 @@ REPO = "tilework-tech/nori-skillsets"
 BRANCH_REF = "heads/main"
 TAG_PREFIX = "skillsets-v"
 
+_REF_PREFIX = f"refs/tags/{TAG_PREFIX}"
+_REF_PREFIX_LEN = len(_REF_PREFIX)
+
+_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+(?:-[a-zA-Z]+\.\d+)?$")
+_SEMVER_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)(?:-.*)?$")
+
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -130,15 +137,16 @@ def main(argv: list[str]) -> int:
         if args.version:
             version = args.version.lstrip("v")
             # Validate version format
-            if not re.match(r"^\d+\.\d+\.\d+(-[a-zA-Z]+\.\d+)?$", version):
+            if not _VERSION_RE.match(version):
                 raise ReleaseError(f"Invalid version format: {version}")
         else:
             version = determine_version(args)
 
         tag_name = f"{TAG_PREFIX}{version}"
 
-        # Check if tag already exists
-        if tag_exists(tag_name):
+        # Check if tag already exists, reusing the (cached) remote tag listing
+        known_tags = {f"{TAG_PREFIX}{v}" for v in list_tags()}
+        if tag_exists(tag_name, known_tags=known_tags):
             raise ReleaseError(f"Tag {tag_name} already exists")
 
         print(f"Publishing version {version}")
@@ -199,7 +207,9 @@ def run_gh_api(
         json_payload = json.dumps(payload)
         command.extend(["-H", "Content-Type: application/json", "--input", "-"])
 
-    result = subprocess.run(command, text=True, capture_output=True, input=json_payload)
+    result = subprocess.run(
+        command, encoding="utf-8", capture_output=True, input=json_payload
+    )
     if result.returncode != 0:
         message = result.stderr.strip() or result.stdout.strip() or "gh api call failed"
         raise ReleaseError(message)
@@ -211,17 +221,24 @@ def run_gh_api(
 
 def run_git(args: list[str], *, check: bool = True) -> subprocess.CompletedProcess:
     """Run a git command."""
-    result = subprocess.run(["git"] + args, text=True, capture_output=True)
+    result = subprocess.run(["git"] + args, encoding="utf-8", capture_output=True)
     if check and result.returncode != 0:
         message = result.stderr.strip() or result.stdout.strip() or "git command failed"
         raise ReleaseError(f"git {' '.join(args)}: {message}")
     return result
 
 
-def tag_exists(tag_name: str) -> bool:
-    """Check if a tag already exists."""
+def tag_exists(tag_name: str, *, known_tags: Optional[set[str]] = None) -> bool:
+    """Check if a tag already exists.
+
+    When known_tags is given (full tag names, prefix included), the check is
+    answered from it without another GitHub API call. Otherwise a HEAD request
+    is used, since only the status matters and not the ref body.
+    """
+    if known_tags is not None:
+        return tag_name in known_tags
     try:
-        run_gh_api(f"/repos/{REPO}/git/refs/tags/{tag_name}")
+        run_gh_api(f"/repos/{REPO}/git/refs/tags/{tag_name}", method="HEAD")
         return True
     except ReleaseError:
         return False
@@ -266,17 +283,13 @@ def determine_version(args: argparse.Namespace) -> str:
         # For next releases, use the current stable version as base
         # e.g., if latest stable is 1.2.0, create 1.2.0-next.1, 1.2.0-next.2, etc.
         next_prefix = f"{current_stable_version}-next."
-        tags = list_tags()
+        next_re = re.compile(re.escape(next_prefix) + r"(\d+)$")
         highest_next = 0
 
-        for version in tags:
-            if version.startswith(next_prefix):
-                suffix = version[len(next_prefix) :]
-                try:
-                    next_number = int(suffix)
-                except ValueError:
-                    continue
-                highest_next = max(highest_next, next_number)
+        for version in list_tags():
+            match = next_re.match(version)
+            if match:
+                highest_next = max(highest_next, int(match[1]))
 
         return f"{next_prefix}{highest_next + 1}"
 
@@ -284,31 +297,34 @@ def determine_version(args: argparse.Namespace) -> str:
     raise ReleaseError("Unable to determine version")
 
 
-def list_tags() -> list[str]:
+@functools.cache
+def list_tags() -> tuple[str, ...]:
     """List all tags matching TAG_PREFIX, returning version strings.
 
     Uses `git ls-remote` rather than the REST API: it returns every matching
     tag in a single git-protocol round trip with no pagination, no ref-count
     cap, and no REST rate-limiting exposure. (The git/refs/tags REST endpoint
     ignores per_page/page and silently truncates at 1000 refs, so it cannot be
-    paginated correctly.)
+    paginated correctly.) `--refs` suppresses the peeled "<ref>^{}" line that
+    annotated tags would otherwise add, halving the output.
+
+    The result is cached for the life of the process so that
+    get_latest_release_version and determine_version share one remote query.
     """
     result = run_git(
-        ["ls-remote", "--tags", "origin", f"refs/tags/{TAG_PREFIX}*"], check=False
+        ["ls-remote", "--tags", "--refs", "origin", f"{_REF_PREFIX}*"],
+        check=False,
     )
     if result.returncode != 0:
-        return []
+        return ()
 
-    prefix = f"refs/tags/{TAG_PREFIX}"
     tags: list[str] = []
     for line in result.stdout.splitlines():
-        # Each line is "<sha>\t<ref>". Annotated tags also emit a peeled
-        # "<ref>^{}" line, which we skip to avoid duplicates.
+        # Each line is "<sha>\t<ref>".
         _, _, ref = line.partition("\t")
-        if not ref.startswith(prefix) or ref.endswith("^{}"):
-            continue
-        tags.append(ref[len(prefix) :])
-    return tags
+        if ref.startswith(_REF_PREFIX):
+            tags.append(ref[_REF_PREFIX_LEN:])
+    return tuple(tags)
 
 
 def get_latest_release_version() -> Optional[str]:
@@ -317,36 +333,34 @@ def get_latest_release_version() -> Optional[str]:
     Uses git tags instead of GitHub Releases to be robust against
     incomplete release workflows.
     """
-    tags = list_tags()
-    stable_versions: list[tuple[int, int, int]] = []
+    highest: Optional[tuple[int, int, int]] = None
 
-    for version in tags:
+    for version in list_tags():
         # Skip prerelease versions (contain '-')
         if "-" in version:
             continue
         try:
             semver = parse_semver(version)
-            stable_versions.append(semver)
         except ReleaseError:
             continue
+        if highest is None or semver > highest:
+            highest = semver
 
-    if not stable_versions:
+    if highest is None:
         return None
 
-    highest = max(stable_versions)
     return format_version(*highest)
 
 
 def parse_semver(version: str) -> tuple[int, int, int]:
-    """Parse a semver version string into components."""
-    base_version = version.split("-")[0]
-    parts = base_version.split(".")
-    if len(parts) != 3:
+    """Parse a semver version string into components.
+
+    Any prerelease suffix is ignored.
+    """
+    match = _SEMVER_RE.match(version)
+    if not match:
         raise ReleaseError(f"Unexpected version format: {version}")
-    try:
-        return int(parts[0]), int(parts[1]), int(parts[2])
-    except ValueError as error:
-        raise ReleaseError(f"Version components must be integers: {version}") from error
+    return int(match[1]), int(match[2]), int(match[3])
 
 
 def format_version(major: int, minor: int, patch: int) -> str:
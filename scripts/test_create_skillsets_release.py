@@ -17,16 +17,15 @@ _SPEC.loader.exec_module(release)
 
 
 def _ls_remote_output(versions: list[str]) -> str:
-    """Render `git ls-remote --tags` output for the given matching versions.
+    """Render `git ls-remote --tags --refs` output for the given versions.
 
-    Annotated tags emit both the tag ref and a peeled "^{}" ref; list_tags
-    must dedupe those. A non-matching ref is included to exercise filtering.
+    `--refs` omits peeled "^{}" refs, so each tag appears once. A
+    non-matching ref is included to exercise filtering.
     """
     lines = []
     for v in versions:
         sha = "0" * 40
         lines.append(f"{sha}\trefs/tags/{release.TAG_PREFIX}{v}")
-        lines.append(f"{sha}\trefs/tags/{release.TAG_PREFIX}{v}^{{}}")
     lines.append(f"{'1' * 40}\trefs/tags/some-other-tag")
     return "\n".join(lines) + "\n"
 
@@ -38,9 +37,12 @@ def _completed(stdout: str, returncode: int = 0) -> subprocess.CompletedProcess:
 
 
 class ListTagsTest(unittest.TestCase):
-    def test_parses_remote_tags_and_dedupes_peeled_refs(self):
+    def setUp(self):
+        release.list_tags.cache_clear()
+
+    def test_parses_remote_tags_without_peeled_refs(self):
         """list_tags reads tags from the remote in a single call, strips the
-        prefix, drops non-matching refs, and does not double-count the peeled
+        prefix, drops non-matching refs, and asks git to omit the peeled
         "^{}" refs that annotated tags produce.
         """
         with mock.patch.object(
@@ -51,6 +53,7 @@ class ListTagsTest(unittest.TestCase):
             tags = release.list_tags()
 
         self.assertEqual(run_git.call_count, 1)
+        self.assertIn("--refs", run_git.call_args.args[0])
         self.assertEqual(sorted(tags), ["0.1.0", "0.2.0", "0.26.0"])
         self.assertNotIn("some-other-tag", tags)
 
@@ -61,7 +64,73 @@ class ListTagsTest(unittest.TestCase):
         with mock.patch.object(
             release, "run_git", return_value=_completed("", returncode=128)
         ):
-            self.assertEqual(release.list_tags(), [])
+            self.assertEqual(release.list_tags(), ())
+
+    def test_latest_release_ignores_prereleases_and_malformed_tags(self):
+        with mock.patch.object(
+            release,
+            "run_git",
+            return_value=_completed(
+                _ls_remote_output(["0.9.0", "0.10.0", "0.11.0-next.1", "bogus"])
+            ),
+        ):
+            self.assertEqual(release.get_latest_release_version(), "0.10.0")
+
+    def test_publish_next_queries_remote_once(self):
+        """determine_version(--publish-next) reads the tag list for both the
+        latest stable lookup and the -next.N scan; the cache means only one
+        ls-remote is issued.
+        """
+        args = release.parse_args(["prog", "--publish-next"])
+        with mock.patch.object(
+            release,
+            "run_git",
+            return_value=_completed(
+                _ls_remote_output(["0.2.0", "0.2.0-next.1", "0.2.0-next.2"])
+            ),
+        ) as run_git:
+            version = release.determine_version(args)
+
+        self.assertEqual(version, "0.2.0-next.3")
+        self.assertEqual(run_git.call_count, 1)
+
+
+class TagExistsTest(unittest.TestCase):
+    def test_uses_known_tags_without_api_call(self):
+        known = {f"{release.TAG_PREFIX}0.2.0"}
+        with mock.patch.object(release, "run_gh_api") as run_gh_api:
+            self.assertTrue(
+                release.tag_exists(f"{release.TAG_PREFIX}0.2.0", known_tags=known)
+            )
+            self.assertFalse(
+                release.tag_exists(f"{release.TAG_PREFIX}0.3.0", known_tags=known)
+            )
+        run_gh_api.assert_not_called()
+
+    def test_falls_back_to_head_request(self):
+        tag_name = f"{release.TAG_PREFIX}0.2.0"
+        with mock.patch.object(release, "run_gh_api", return_value={}) as run_gh_api:
+            self.assertTrue(release.tag_exists(tag_name))
+        run_gh_api.assert_called_once_with(
+            f"/repos/{release.REPO}/git/refs/tags/{tag_name}", method="HEAD"
+        )
+
+        with mock.patch.object(
+            release, "run_gh_api", side_effect=release.ReleaseError("Not Found")
+        ):
+            self.assertFalse(release.tag_exists(tag_name))
+
+
+class ParseSemverTest(unittest.TestCase):
+    def test_parses_release_and_prerelease_versions(self):
+        self.assertEqual(release.parse_semver("1.2.3"), (1, 2, 3))
+        self.assertEqual(release.parse_semver("0.26.0-next.4"), (0, 26, 0))
+
+    def test_rejects_malformed_versions(self):
+        for version in ["1.2", "1.2.3.4", "1.x.3", ""]:
+            with self.subTest(version=version):
+                with self.assertRaises(release.ReleaseError):
+                    release.parse_semver(version)
 
 
 if __name__ == "__main__":